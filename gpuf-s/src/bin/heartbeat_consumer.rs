@@ -115,6 +115,26 @@ async fn main() -> Result<()> {
                     error!("Failed to refresh device_points_daily: {}", e);
                 }
             }
+
+            // CONCURRENTLY so dashboard reads are not blocked during the
+            // refresh; it is legal here as a single statement outside an
+            // explicit transaction, unlike inside a plpgsql function
+            let res =
+                sqlx::query("REFRESH MATERIALIZED VIEW CONCURRENTLY dashboard_device_daily;")
+                    .execute(&points_pool)
+                    .await;
+
+            match res {
+                Ok(_) => {
+                    info!(
+                        "Refreshed dashboard_device_daily (interval_secs={})",
+                        points_refresh_interval_secs
+                    );
+                }
+                Err(e) => {
+                    error!("Failed to refresh dashboard_device_daily: {}", e);
+                }
+            }
         }
     });
 
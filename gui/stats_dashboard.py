@@ -1,16 +1,23 @@
 import sys
 import signal
+from contextlib import contextmanager
 import psycopg2
 from psycopg2 import pool
 import time
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                           QHBoxLayout, QLabel, QComboBox, QDateEdit, 
-                           QPushButton, QTabWidget, QTableWidget, 
-                           QTableWidgetItem, QHeaderView, QFileDialog,
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
+                           QHBoxLayout, QLabel, QComboBox, QDateEdit,
+                           QPushButton, QTabWidget, QTableView,
+                           QHeaderView, QFileDialog,
                            QMessageBox)
-from PyQt5.QtCore import QDate, Qt, QLocale
+from PyQt5.QtCore import (QAbstractTableModel, QDate, QModelIndex, Qt,
+                          QLocale, QObject, QRunnable, QThreadPool,
+                          QTimer, pyqtSignal)
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+import matplotlib.dates as mdates
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import traceback
@@ -25,11 +32,247 @@ try:
 except:
     pass
 
+class PreparedStatementConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statement names it has PREPAREd
+
+    The stock C connection type has no instance __dict__, so the
+    per-connection prepared-statement cache lives on this subclass,
+    installed through the pool's connection_factory.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+
+class StatsQueryTask(QRunnable):
+    """Run the client/device stat queries on a pool thread
+
+    Keeps the GUI thread free to process paint/input events while the
+    Postgres round-trips are in flight. Results are handed back through
+    signals so plotting still happens on the main thread.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(object, object)  # client_df, device_df
+        failed = pyqtSignal(str)
+
+    def __init__(self, dashboard, start_date, end_date, client_id, device_id):
+        super().__init__()
+        self.signals = StatsQueryTask.Signals()
+        self.cancelled = False
+        self._dashboard = dashboard
+        self._start_date = start_date
+        self._end_date = end_date
+        self._client_id = client_id
+        self._device_id = device_id
+
+    def run(self):
+        dashboard = self._dashboard
+        try:
+            with dashboard.db(show_warning=False) as conn:
+                if not conn:
+                    self.signals.failed.emit("Cannot get database connection, please try again later")
+                    return
+
+                client_df, device_df = dashboard.load_stats(
+                    conn,
+                    self._start_date,
+                    self._end_date,
+                    client_id=self._client_id if self._client_id != "all" else None,
+                    device_id=self._device_id if self._device_id != "all" else None
+                )
+
+            if not self.cancelled:
+                self.signals.finished.emit(client_df, device_df)
+        except Exception as e:
+            traceback.print_exc()
+            if not self.cancelled:
+                self.signals.failed.emit(str(e))
+
+
+class TableQueryTask(QRunnable):
+    """Stream the detailed-table query on a pool thread
+
+    Rows are handed back to the GUI thread in chunks through signals, so
+    the table fills progressively while the UI keeps processing events.
+    """
+
+    class Signals(QObject):
+        columns = pyqtSignal(list)
+        rows = pyqtSignal(list)
+        finished = pyqtSignal()
+        failed = pyqtSignal(str)
+
+    def __init__(self, dashboard, query, params):
+        super().__init__()
+        self.signals = TableQueryTask.Signals()
+        self.cancelled = False
+        self._dashboard = dashboard
+        self._query = query
+        self._params = params
+
+    def run(self):
+        dashboard = self._dashboard
+        try:
+            with dashboard.db(show_warning=False) as conn:
+                if not conn:
+                    self.signals.failed.emit("Cannot get database connection, please try again later")
+                    return
+
+                # Named cursor keeps the result set on the server; rows
+                # stream over in batches instead of one giant fetchall
+                cursor = conn.cursor(name='table_stream')
+                cursor.itersize = dashboard.TABLE_FETCH_BATCH
+                try:
+                    cursor.execute(self._query, self._params)
+
+                    # description is only populated once the server-side
+                    # cursor has been fetched from
+                    chunk = cursor.fetchmany(dashboard.TABLE_FETCH_BATCH)
+                    if not self.cancelled:
+                        self.signals.columns.emit(
+                            [desc[0] for desc in cursor.description])
+                    while chunk and not self.cancelled:
+                        self.signals.rows.emit(list(chunk))
+                        chunk = cursor.fetchmany(dashboard.TABLE_FETCH_BATCH)
+                finally:
+                    try:
+                        cursor.close()
+                    except Exception:
+                        pass
+
+            if not self.cancelled:
+                self.signals.finished.emit()
+        except Exception as e:
+            traceback.print_exc()
+            if not self.cancelled:
+                self.signals.failed.emit(str(e))
+
+
+class StatsTableModel(QAbstractTableModel):
+    """Read-only model over raw query rows for the detailed-data table
+
+    Holds the row tuples by reference and formats cells on demand, so
+    loading a result set is one model reset instead of one Qt item
+    allocation per cell.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._columns = []
+        # (row, column) -> display string, filled lazily by data();
+        # repaints and any future sort/filter proxies hit the cache
+        # instead of re-stringifying Decimal/datetime/bytes values
+        self._cell_cache = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._columns[section]
+        return section + 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.EditRole:
+            # raw value, so sorting/filtering compares natively
+            return self._rows[index.row()][index.column()]
+        if role != Qt.DisplayRole:
+            return None
+        key = (index.row(), index.column())
+        text = self._cell_cache.get(key)
+        if text is None:
+            value = self._rows[key[0]][key[1]]
+            if value is None:
+                text = ""
+            elif isinstance(value, (bytes, memoryview)):
+                # BYTEA ids render as their short hex form
+                text = bytes(value).hex()[:8] + '...'
+            else:
+                text = str(value)
+            self._cell_cache[key] = text
+        return text
+
+    def flags(self, index):
+        # view-only table; no ItemIsEditable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def set_rows(self, rows, columns):
+        """Swap in a new result set with a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self._columns = list(columns)
+        self._cell_cache.clear()
+        self.endResetModel()
+
+    def begin_rows(self, columns):
+        """Reset to an empty result set, ready for append_rows chunks"""
+        self.set_rows([], columns)
+
+    def append_rows(self, rows):
+        """Append a fetched chunk with a single rowsInserted signal"""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+
 class StatsDashboard(QMainWindow):
+    # How long cached information_schema lookups stay valid (seconds)
+    SCHEMA_CACHE_TTL = 300
+
+    # Above this many points per series, plotted data is resampled
+    PLOT_POINT_BUDGET = 2000
+
+    # How long cached stats results are reused for an unchanged
+    # filter/date selection (seconds)
+    STATS_CACHE_TTL = 60
+
+    # Rows fetched per round-trip when streaming the detailed table
+    TABLE_FETCH_BATCH = 5000
+
+    # Rapid filter changes within this window collapse into one reload
+    REFRESH_DEBOUNCE_MS = 150
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("GPU Usage Statistics Dashboard")
         self.setGeometry(100, 100, 1200, 800)
+
+        # In-memory caches for rarely-changing lookups
+        self._schema_cache = {}  # table name -> (columns, fetched_at)
+        self._clients_cache = None  # rows backing the client combo
+
+        # Session cache of stats results, keyed on the filter selection;
+        # the version counter lets Refresh invalidate everything at once
+        self._stats_cache = {}  # key -> (client_df, device_df, fetched_at)
+        self._stats_cache_version = 0
+
+        # Key of the selection the charts currently show; lets repeat
+        # renders of identical cached data be skipped outright
+        self._last_plot_key = None
+
+        # Stats / table queries currently running on the thread pool
+        self._current_task = None
+        self._current_table_task = None
+
+        # Debounce timer: filter changes only trigger a reload once the
+        # user has settled for REFRESH_DEBOUNCE_MS
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._apply_filter_change)
+        self._pending_client_change = False
         
         # Database connection configuration
         self.db_config = {
@@ -40,17 +283,22 @@ class StatsDashboard(QMainWindow):
             'port': '5432'
         }
         
-        # Initialize connection pool
+        # Initialize connection pool; ThreadedConnectionPool because the
+        # stats queries check connections out from pool worker threads
         try:
-            self.db_pool = psycopg2.pool.SimpleConnectionPool(
+            self.db_pool = psycopg2.pool.ThreadedConnectionPool(
                 minconn=3,  # Minimum connections
                 maxconn=20,  # Maximum connections
+                connection_factory=PreparedStatementConnection,
                 **self.db_config
             )
             # Test if connection pool works
             conn = self.get_db_connection()
             if not conn:
                 raise Exception("Cannot establish initial database connection")
+            # Detect the available device metric columns once, so the stats
+            # SQL text stays stable (and thus cacheable server-side)
+            self._device_metric_cols = frozenset(self._get_columns(conn, 'device_daily_stats'))
             self.release_db_connection(conn)
             print("Database connection pool initialized successfully")
         except Exception as e:
@@ -64,8 +312,15 @@ class StatsDashboard(QMainWindow):
         # Load data after UI is initialized
         self.load_data()
     
-    def get_db_connection(self, max_retries=3, retry_delay=1):
-        """Get database connection with retry mechanism"""
+    def get_db_connection(self, max_retries=3, retry_delay=1, show_warning=True):
+        """Get database connection with retry mechanism
+
+        Args:
+            max_retries: number of checkout attempts before giving up
+            retry_delay: seconds to sleep between attempts
+            show_warning: pop a QMessageBox on failure; pass False from
+                worker threads, where widgets must not be touched
+        """
         last_exception = None
         conn = None
         for attempt in range(max_retries):
@@ -73,9 +328,11 @@ class StatsDashboard(QMainWindow):
                 if not self.db_pool:
                     raise Exception("Database connection pool not initialized")
                 conn = self.db_pool.getconn()
-                # Test the connection before returning it
-                with conn.cursor() as cur:
-                    cur.execute('SELECT 1')
+                # No liveness ping here: an extra SELECT 1 per checkout
+                # doubles round-trips, and a dead connection fails at the
+                # real query anyway, where errors are already handled
+                if conn.closed:
+                    raise psycopg2.OperationalError("pooled connection is closed")
                 return conn
             except Exception as e:
                 if conn:
@@ -89,9 +346,25 @@ class StatsDashboard(QMainWindow):
                 time.sleep(retry_delay)
         
         print(f"Failed to get database connection after {max_retries} retries: {last_exception}")
-        QMessageBox.warning(self, "Warning", "Cannot get database connection, please try again later")
+        if show_warning:
+            QMessageBox.warning(self, "Warning", "Cannot get database connection, please try again later")
         return None
 
+    @contextmanager
+    def db(self, show_warning=True):
+        """Check out a pooled connection for the duration of a block
+
+        Yields None when no connection could be acquired; callers must
+        handle that case. The connection is always returned to the pool,
+        including on exceptions.
+        """
+        conn = self.get_db_connection(show_warning=show_warning)
+        try:
+            yield conn
+        finally:
+            if conn:
+                self.release_db_connection(conn)
+
     def release_db_connection(self, conn):
         """Release database connection back to pool"""
         if not conn or not self.db_pool:
@@ -139,6 +412,14 @@ class StatsDashboard(QMainWindow):
         self.client_layout = QVBoxLayout(self.client_tab)
         self.client_figure = Figure(figsize=(10, 6), dpi=100)
         self.client_canvas = FigureCanvas(self.client_figure)
+        # Persistent subplots (plus their twin y-axes); plot_client_stats
+        # updates line data in place instead of rebuilding the figure
+        self.client_axes = [self.client_figure.add_subplot(211),
+                            self.client_figure.add_subplot(212)]
+        self.client_twin_axes = [ax.twinx() for ax in self.client_axes]
+        # metric key -> (LineCollection, marker PathCollection)
+        self._client_collections = {}
+        self._client_placeholder = False
         self.client_layout.addWidget(self.client_canvas)
         
         # Device statistics tab
@@ -146,14 +427,28 @@ class StatsDashboard(QMainWindow):
         self.device_layout = QVBoxLayout(self.device_tab)
         self.device_figure = Figure(figsize=(10, 6), dpi=100)
         self.device_canvas = FigureCanvas(self.device_figure)
+        # Persistent subplots; plot_device_stats updates line data in place
+        # instead of rebuilding the figure on every refresh
+        self.device_axes = [self.device_figure.add_subplot(211),
+                            self.device_figure.add_subplot(212)]
+        self._device_lines = {}  # (subplot key, device label) -> Line2D
+        self._device_placeholder = False
+        # Blitting state: the device lines are animated artists, so full
+        # draws leave them out of the captured background and data-only
+        # updates can restore + redraw just the lines
+        self._device_bg = None
+        self.device_canvas.mpl_connect('draw_event', self._on_device_draw)
         self.device_layout.addWidget(self.device_canvas)
         
         # Data table tab
         self.table_tab = QWidget()
         self.table_layout = QVBoxLayout(self.table_tab)
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(0)
-        self.data_table.setRowCount(0)
+        # Model/view table: the model serves cells straight from the row
+        # tuples, so big result sets avoid per-cell item allocation
+        self.table_model = StatsTableModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.table_model)
+        self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.table_layout.addWidget(self.data_table)
         
         # Add tabs
@@ -172,12 +467,14 @@ class StatsDashboard(QMainWindow):
         self.start_date = QDateEdit()
         self.start_date.setDate(QDate.currentDate().addDays(-7))
         self.start_date.setCalendarPopup(True)
+        self.start_date.dateChanged.connect(self.on_dates_changed)
         panel.addWidget(self.start_date)
-        
+
         panel.addWidget(QLabel("End Date:"))
         self.end_date = QDateEdit()
         self.end_date.setDate(QDate.currentDate())
         self.end_date.setCalendarPopup(True)
+        self.end_date.dateChanged.connect(self.on_dates_changed)
         panel.addWidget(self.end_date)
         
         # Client selection
@@ -195,7 +492,7 @@ class StatsDashboard(QMainWindow):
         
         # Refresh button
         refresh_btn = QPushButton("Refresh Data")
-        refresh_btn.clicked.connect(self.load_data)
+        refresh_btn.clicked.connect(self.refresh_data)
         refresh_btn.setStyleSheet("""
             QPushButton {
                 background-color: #4CAF50;
@@ -218,242 +515,332 @@ class StatsDashboard(QMainWindow):
         
         return panel
     
+    def refresh_data(self):
+        """Explicit refresh: drop cached lookups, then reload everything"""
+        self._clients_cache = None
+        self._schema_cache.clear()
+        # Bumping the version makes every cached stats key stale
+        self._stats_cache_version += 1
+        self._stats_cache.clear()
+        self._last_plot_key = None
+        self.load_data()
+
+    def _get_columns(self, conn, table):
+        """Get column names for a table, cached with a short TTL
+
+        Args:
+            conn: database connection
+            table: table name to look up in information_schema
+
+        Returns:
+            list[str]: column names in ordinal position order
+        """
+        cached = self._schema_cache.get(table)
+        if cached and time.time() - cached[1] < self.SCHEMA_CACHE_TTL:
+            return cached[0]
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name = %s
+                ORDER BY ordinal_position
+            """, (table,))
+            columns = [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+        self._schema_cache[table] = (columns, time.time())
+        return columns
+
     def load_data(self, from_client_changed=False):
         """Load data
         
         Args:
             from_client_changed: Whether triggered by client change event, used to prevent circular calls
         """
-        # Prevent re-entry
-        if hasattr(self, '_is_loading') and self._is_loading:
-            return
-            
-        self._is_loading = True
-        conn = None
-        
         try:
-            conn = self.get_db_connection()
-            if not conn:
-                QMessageBox.warning(self, "Warning", "Cannot get database connection, please try again later")
+            # Serve repeat requests for an unchanged selection (tab clicks,
+            # redundant reloads) from the session cache without touching
+            # the database at all
+            cache_key = (self._stats_cache_version,
+                         self.start_date.date().toString("yyyy-MM-dd"),
+                         self.end_date.date().toString("yyyy-MM-dd"),
+                         self.client_combo.currentData(),
+                         self.device_combo.currentData())
+            cached = self._stats_cache.get(cache_key)
+            if cached and time.time() - cached[2] < self.STATS_CACHE_TTL:
+                if cache_key == self._last_plot_key:
+                    # charts already show exactly this selection
+                    print("Filters unchanged, charts already current")
+                    return
+                print("Filters unchanged, using cached statistics")
+                client_df, device_df = cached[0], cached[1]
+                self.plot_client_stats(client_df)
+                self.client_canvas.draw_idle()
+                self.plot_device_stats(device_df)
+                self._last_plot_key = cache_key
                 return
-                
-            # Get date range
-            start_date = self.start_date.date().toString("yyyy-MM-dd")
-            end_date = self.end_date.date().toString("yyyy-MM-dd")
-            
-            print(f"Loading data for date range: {start_date} to {end_date}")
-            
-            # Get currently selected client and device
-            selected_client = self.client_combo.currentData()
-            selected_device = self.device_combo.currentData()
-            
-            # Only update client and device lists if not triggered by client change event
-            if not from_client_changed:
+
+            with self.db() as conn:
+                if not conn:
+                    QMessageBox.warning(self, "Warning", "Cannot get database connection, please try again later")
+                    return
+
+                # Get date range
+                start_date = self.start_date.date().toString("yyyy-MM-dd")
+                end_date = self.end_date.date().toString("yyyy-MM-dd")
+
+                print(f"Loading data for date range: {start_date} to {end_date}")
+
+                # Get currently selected client and device
+                selected_client = self.client_combo.currentData()
+                selected_device = self.device_combo.currentData()
+
+                # Only update client and device lists if not triggered by client change event
+                if not from_client_changed:
+                    try:
+                        # Block signals to prevent triggering on_client_changed
+                        self.client_combo.blockSignals(True)
+                        self.device_combo.blockSignals(True)
+
+                        # Save currently selected client and device
+                        current_client = self.client_combo.currentData()
+                        current_device = self.device_combo.currentData()
+
+                        # Reload client and device lists (one round-trip)
+                        self.load_combo_lists(conn, current_client)
+
+                        # Restore selected client and device
+                        if current_client:
+                            index = self.client_combo.findData(current_client)
+                            if index >= 0:
+                                self.client_combo.setCurrentIndex(index)
+
+                        if current_device:
+                            index = self.device_combo.findData(current_device)
+                            if index >= 0:
+                                self.device_combo.setCurrentIndex(index)
+
+                    except Exception as e:
+                        print(f"Failed to load client/device list: {e}")
+                        traceback.print_exc()
+                        QMessageBox.warning(self, "Warning", "Failed to load client/device list, please check network connection")
+                        return
+                    finally:
+                        # Restore signals
+                        self.client_combo.blockSignals(False)
+                        self.device_combo.blockSignals(False)
+
+                # Stats queries and plotting happen off the GUI thread; results
+                # come back through _on_stats_ready
+                self._submit_stats_task(start_date, end_date, selected_client, selected_device)
+
+                # Load table data
                 try:
-                    # Block signals to prevent triggering on_client_changed
-                    self.client_combo.blockSignals(True)
-                    self.device_combo.blockSignals(True)
-                    
-                    # Save currently selected client and device
-                    current_client = self.client_combo.currentData()
-                    current_device = self.device_combo.currentData()
-                    
-                    # Reload client and device lists
-                    self.load_clients(conn)
-                    self.load_devices(conn, current_client)
-                    
-                    # Restore selected client and device
-                    if current_client:
-                        index = self.client_combo.findData(current_client)
-                        if index >= 0:
-                            self.client_combo.setCurrentIndex(index)
-                    
-                    if current_device:
-                        index = self.device_combo.findData(current_device)
-                        if index >= 0:
-                            self.device_combo.setCurrentIndex(index)
-                    
+                    current_tab = self.tabs.currentIndex()
+                    if current_tab == 0:  # Client statistics
+                        self.load_table_data(start_date, end_date, 'client', selected_client)
+                    else:  # Device statistics
+                        if selected_client and selected_client != "all":
+                            device_index = self.device_combo.currentData()
+                            self.load_table_data(start_date, end_date, 'device', device_index)
+                        else:
+                            print("No specific client selected, clear device table")
+                            self.update_table([], [])
                 except Exception as e:
-                    print(f"Failed to load client/device list: {e}")
+                    print(f"Failed to load table data: {e}")
                     traceback.print_exc()
-                    QMessageBox.warning(self, "Warning", "Failed to load client/device list, please check network connection")
-                    return
-                finally:
-                    # Restore signals
-                    self.client_combo.blockSignals(False)
-                    self.device_combo.blockSignals(False)
-            
-            # Load client statistics data
-            try:
-                # Clear existing client charts
-                self.client_figure.clear()
-                self.client_canvas.draw()
-                
-                # Load new client statistics data
-                client_df = self.load_client_stats(conn, start_date, end_date, selected_client)
-                
-                # If data was returned but chart not updated, force redraw
-                if client_df is not None and not client_df.empty:
-                    self.plot_client_stats(client_df)
-                    self.client_canvas.draw()
-            except Exception as e:
-                print(f"Failed to load client statistics data: {e}")
-                traceback.print_exc()
-                QMessageBox.warning(self, "Error", f"Failed to load client statistics data: {str(e)}")
-            
-            # Load device statistics data
-            try:
-                # Clear existing device charts
-                self.device_figure.clear()
-                self.device_canvas.draw()
-                
-                # Get selected device and client
-                device_index = self.device_combo.currentData()
-                client_id = self.client_combo.currentData()
-                
-                # Load device statistics data
-                device_df = self.load_device_stats(
-                    conn, 
-                    start_date, 
-                    end_date, 
-                    device_id=device_index if device_index != "all" else None,
-                    client_id=client_id if client_id != "all" else None
-                )
-                
-                # If data was returned, plot chart
-                if device_df is not None and not device_df.empty:
-                    self.plot_device_stats(device_df)
-                    self.device_canvas.draw()
-                else:
-                    print("No device statistics data found")
-            except Exception as e:
-                print(f"Failed to load device statistics data: {e}")
-                traceback.print_exc()
-                QMessageBox.warning(self, "Error", f"Failed to load device statistics data: {str(e)}")
-            
-            # Load table data
-            try:
-                current_tab = self.tabs.currentIndex()
-                if current_tab == 0:  # Client statistics
-                    self.load_table_data(conn, start_date, end_date, 'client', selected_client)
-                else:  # Device statistics
-                    if selected_client and selected_client != "all":
-                        device_index = self.device_combo.currentData()
-                        self.load_table_data(conn, start_date, end_date, 'device', device_index)
-                    else:
-                        print("No specific client selected, clear device table")
-                        self.update_table([], [])
-            except Exception as e:
-                print(f"Failed to load table data: {e}")
-                traceback.print_exc()
-                QMessageBox.warning(self, "Error", f"Failed to load table data: {str(e)}")
-                
+                    QMessageBox.warning(self, "Error", f"Failed to load table data: {str(e)}")
+
         except Exception as e:
             print(f"Error occurred while loading data: {e}")
             traceback.print_exc()
             QMessageBox.critical(self, "Error", f"Error occurred while loading data: {str(e)}")
-        finally:
-            self.release_db_connection(conn)
-            self._is_loading = False
-    
+
+    def _submit_stats_task(self, start_date, end_date, client_id, device_id):
+        """Submit the chart queries to the global thread pool
+
+        A task already in flight is marked cancelled so its (stale) results
+        are dropped when it eventually finishes.
+        """
+        if self._current_task:
+            self._current_task.cancelled = True
+
+        task = StatsQueryTask(self, start_date, end_date, client_id, device_id)
+        # the cache key travels with the task, and the slots check the
+        # emitting task's identity (mirroring the table path) so a
+        # superseded task cannot store results under the new selection
+        task.cache_key = (self._stats_cache_version, start_date,
+                          end_date, client_id, device_id)
+        task.signals.finished.connect(
+            lambda client_df, device_df, task=task:
+                self._on_stats_ready(task, client_df, device_df))
+        task.signals.failed.connect(
+            lambda message, task=task: self._on_stats_failed(task, message))
+        self._current_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_stats_ready(self, task, client_df, device_df):
+        """Plot stats query results (runs on the GUI thread)"""
+        if task is not self._current_task:
+            return
+        self._current_task = None
+        self._stats_cache[task.cache_key] = (
+            client_df, device_df, time.time())
+        self._last_plot_key = task.cache_key
+        self.plot_client_stats(client_df)
+        self.client_canvas.draw_idle()
+        self.plot_device_stats(device_df)
+
+    def _on_stats_failed(self, task, message):
+        """Report a failed stats query (runs on the GUI thread)"""
+        if task is not self._current_task:
+            return
+        self._current_task = None
+        QMessageBox.warning(self, "Error", f"Failed to load statistics data: {message}")
+
     def on_client_changed(self, index):
-        """ when client changed """
+        """when client changed: debounce, only the final selection loads"""
         if index < 0:  # invalid index
             return
-            
-        # prevent re-entry
-        if hasattr(self, '_is_loading') and self._is_loading:
+
+        self._pending_client_change = True
+        self._refresh_timer.start(self.REFRESH_DEBOUNCE_MS)
+
+    def on_dates_changed(self, *_):
+        """when a date picker changed: debounce, then reload"""
+        self._refresh_timer.start(self.REFRESH_DEBOUNCE_MS)
+
+    def _apply_filter_change(self):
+        """Run the (debounced) reload for the latest filter selection"""
+        client_changed = self._pending_client_change
+        self._pending_client_change = False
+
+        if not client_changed:
+            self.load_data(from_client_changed=True)
             return
-            
-        conn = None
+
         try:
             # get selected client id
             client_id = self.client_combo.currentData()
-            
-            conn = self.get_db_connection()
-            if not conn:
-                return
-                
-            # Block signals to prevent triggering multiple updates
-            self.device_combo.blockSignals(True)
-            
-            try:
-                # Save currently selected device
-                current_device = self.device_combo.currentData()
-                
-                # Update device list
-                self.load_devices(conn, client_id)
-                
-                # Restore selected device (if exists)
-                if current_device:
-                    device_index = self.device_combo.findData(current_device)
-                    if device_index >= 0:
-                        self.device_combo.setCurrentIndex(device_index)
-                
-                # Reload data, marked as triggered by client change event
-                self.load_data(from_client_changed=True)
-                
-            except Exception as e:
-                print(f"Error updating device list: {e}")
-                traceback.print_exc()
-                QMessageBox.warning(self, "Error", f"Error updating device list: {str(e)}")
-                
+
+            with self.db() as conn:
+                if not conn:
+                    return
+
+                # Block signals to prevent triggering multiple updates
+                self.device_combo.blockSignals(True)
+
+                try:
+                    # Save currently selected device
+                    current_device = self.device_combo.currentData()
+
+                    # Update device list
+                    self.load_devices(conn, client_id)
+
+                    # Restore selected device (if exists)
+                    if current_device:
+                        device_index = self.device_combo.findData(current_device)
+                        if device_index >= 0:
+                            self.device_combo.setCurrentIndex(device_index)
+
+                    # Reload data, marked as triggered by client change event
+                    self.load_data(from_client_changed=True)
+
+                except Exception as e:
+                    print(f"Error updating device list: {e}")
+                    traceback.print_exc()
+                    QMessageBox.warning(self, "Error", f"Error updating device list: {str(e)}")
+
         except Exception as e:
             print(f"Error handling client change: {e}")
             traceback.print_exc()
             QMessageBox.critical(self, "Error", f"Error handling client change: {str(e)}")
-            
+
         finally:
             # Ensure signals are restored
             if hasattr(self, 'device_combo'):
                 self.device_combo.blockSignals(False)
-            if conn:
-                self.release_db_connection(conn)
-            
-            # Reset loading state
-            if hasattr(self, '_is_loading'):
-                self._is_loading = False
     
     def load_clients(self, conn):
         """Load client list"""
         try:
-            # Start new transaction
-            conn.rollback()
-            cursor = conn.cursor()
-            
-            # Get client information from gpu_assets table
-            cursor.execute("""
-                SELECT DISTINCT ga.client_id, ga.client_name
-                FROM gpu_assets ga
-                WHERE ga.client_id IS NOT NULL
-                ORDER BY ga.client_name, ga.client_id
-            """)
-            
-            self.client_combo.clear()
-            self.client_combo.addItem("All Clients", "all")
-            
-            for row in cursor.fetchall():
-                client_id = row[0]
-                client_name = row[1] if row[1] else f"Client {client_id.hex()[:8]}..."
-                display_name = f"{client_name} ({client_id.hex()[:8]}...)"
-                self.client_combo.addItem(display_name, client_id)
-                
-            # If no data from gpu_assets table, get from client_daily_stats table
-            if self.client_combo.count() <= 1:  # Only "All Clients" item
+            rows = self._clients_cache
+            if rows is None:
+                # Start new transaction
+                conn.rollback()
+                cursor = conn.cursor()
+
+                # Get client information from gpu_assets table
                 cursor.execute("""
-                    SELECT DISTINCT client_id
-                    FROM client_daily_stats
-                    WHERE client_id IS NOT NULL
-                    ORDER BY client_id
+                    SELECT DISTINCT ga.client_id, ga.client_name
+                    FROM gpu_assets ga
+                    WHERE ga.client_id IS NOT NULL
+                    ORDER BY ga.client_name, ga.client_id
                 """)
-                
-                for row in cursor.fetchall():
-                    client_id = row[0]
-                    display_name = f"Client {client_id.hex()[:8]}... ({client_id.hex()[:8]}...)"
-                    self.client_combo.addItem(display_name, client_id)
+                rows = cursor.fetchall()
+
+                # If no data from gpu_assets table, get from client_daily_stats table
+                if not rows:
+                    cursor.execute("""
+                        SELECT DISTINCT client_id
+                        FROM client_daily_stats
+                        WHERE client_id IS NOT NULL
+                        ORDER BY client_id
+                    """)
+                    rows = [(row[0], None) for row in cursor.fetchall()]
+
+                self._clients_cache = rows
+
+            self._populate_client_combo(rows)
         except Exception as e:
             print(f"Failed to load client list: {e}")
             print(traceback.format_exc())
+
+    @staticmethod
+    def _set_combo_items(combo, display_names, item_data):
+        """Replace a combo's items in one batch
+
+        addItems inserts all rows in a single model pass (one
+        rowsInserted/layout update instead of one per item), and the
+        per-item user data is attached with the model's signals blocked.
+        Combo signals are blocked for the whole swap and restored to
+        their previous state, so callers that already block stay blocked.
+
+        Args:
+            combo: the QComboBox to fill
+            display_names: item texts, in order
+            item_data: matching userData values
+        """
+        was_blocked = combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItems(display_names)
+            model = combo.model()
+            model.blockSignals(True)
+            try:
+                for i, data in enumerate(item_data):
+                    combo.setItemData(i, data)
+            finally:
+                model.blockSignals(False)
+        finally:
+            combo.blockSignals(was_blocked)
+
+    def _populate_client_combo(self, rows):
+        """Fill the client combo from (client_id, client_name) rows"""
+        display_names = ["All Clients"]
+        item_data = ["all"]
+        for client_id, client_name in rows:
+            # hex the id once per row; it is reused in both name and suffix
+            prefix = client_id.hex()[:8]
+            if not client_name:
+                client_name = f"Client {prefix}..."
+            display_names.append(f"{client_name} ({prefix}...)")
+            item_data.append(client_id)
+
+        self._set_combo_items(self.client_combo, display_names, item_data)
     
     def load_devices(self, conn, client_id=None):
         """Load device list
@@ -466,16 +853,7 @@ class StatsDashboard(QMainWindow):
             # Start new transaction
             conn.rollback()
             cursor = conn.cursor()
-            
-            # First get actual columns in the table
-            cursor.execute("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'device_daily_stats'
-                ORDER BY ordinal_position
-            """)
-            columns = [row[0] for row in cursor.fetchall()]
-            
+
             # build query
             query = """
                 SELECT DISTINCT d.device_index, d.device_name, d.client_id, g.client_name
@@ -490,308 +868,368 @@ class StatsDashboard(QMainWindow):
                 params.append(client_id)
                 
             query += " ORDER BY d.device_index"
-            
-            cursor.execute(query, params) if params else cursor.execute(query)
-            
-            self.device_combo.clear()
-            self.device_combo.addItem("All Device", "all")
-            
-            # Store currently selected device index (if any)
-            current_device = self.device_combo.currentData()
-            
-            # Clear device dropdown
-            self.device_combo.clear()
-            self.device_combo.addItem("All Device", "all")
-            
-            # Add devices to dropdown
-            for row in cursor.fetchall():
-                device_index = row[0]
-                device_name = row[1] if row[1] else None
-                client_name = row[3] if row[3] else f"Client {row[2].hex()[:8]}..." if row[2] else "Unknown Client"
-                
-                if device_name:
-                    display_name = f"{device_name} (device {device_index}) - {client_name}"
-                else:
-                    display_name = f"device {device_index} - {client_name}"
-                    
-                self.device_combo.addItem(display_name, device_index)
-            
-            # Restore previously selected device (if still exists)
-            if current_device:
-                index = self.device_combo.findData(current_device)
-                if index >= 0:
-                    self.device_combo.setCurrentIndex(index)
+
+            # one stable shape per filter presence; re-executions skip
+            # server-side parse/plan
+            shape = "device_list_c" if params else "device_list"
+            self._execute_prepared(cursor, shape, query, params)
+
+            self._populate_device_combo(cursor.fetchall())
         except Exception as e:
             print(f"Failed to load device list: {e}")
             print(traceback.format_exc())
-    
-    def load_client_stats(self, conn, start_date, end_date, client_id=None):
-        """Load client statistics data
-        
+
+    def _populate_device_combo(self, rows):
+        """Fill the device combo from (device_index, device_name, client_id, client_name) rows"""
+        # Store currently selected device index (if any) before the swap
+        # wipes it; _set_combo_items does the (single) clear itself
+        current_device = self.device_combo.currentData()
+
+        # Build device entries for the batched swap
+        display_names = ["All Device"]
+        item_data = ["all"]
+        for row in rows:
+            device_index = row[0]
+            device_name = row[1] if row[1] else None
+            if row[3]:
+                client_name = row[3]
+            elif row[2]:
+                client_name = f"Client {row[2].hex()[:8]}..."
+            else:
+                client_name = "Unknown Client"
+
+            if device_name:
+                display_name = f"{device_name} (device {device_index}) - {client_name}"
+            else:
+                display_name = f"device {device_index} - {client_name}"
+
+            display_names.append(display_name)
+            item_data.append(device_index)
+
+        self._set_combo_items(self.device_combo, display_names, item_data)
+
+        # Restore previously selected device (if still exists)
+        if current_device:
+            index = self.device_combo.findData(current_device)
+            if index >= 0:
+                self.device_combo.setCurrentIndex(index)
+
+    def load_combo_lists(self, conn, client_id=None):
+        """Load both combo lists in a single round-trip
+
+        Fetches the client and device lists with one UNION ALL query,
+        tagged by a kind column and split in Python. When the client rows
+        are already cached, only the device list is queried.
+
         Args:
-            conn: database connection
-            start_date: start date (yyyy-MM-dd)
-            end_date: end date (yyyy-MM-dd)
-            client_id: optional client ID, if provided only load data for that client
-            
-        Returns:
-            pd.DataFrame: DataFrame containing client statistics data, returns empty DataFrame if error
+            conn: Database connection
+            client_id: Optional client ID filter for the device list
         """
-        cursor = None
-        try:
-            # start new transaction
-            conn.rollback()
-            cursor = conn.cursor()
-            
-            print(f"Loading client stats from {start_date} to {end_date}, client_id: {client_id}")
-            
-            # Build query to get data from client_daily_stats and gpu_assets tables
-            query = """
-                SELECT 
-                    c.date,
-                    c.client_id,
-                    g.client_name,
-                    c.total_heartbeats,
-                    c.avg_cpu_usage,
-                    c.avg_memory_usage,
-                    c.avg_disk_usage,
-                    c.total_network_in_bytes,
-                    c.total_network_out_bytes
-                FROM client_daily_stats c
-                LEFT JOIN gpu_assets g ON c.client_id = g.client_id
-                WHERE c.date >= %s AND c.date <= %s
-            """
-            
-            params = [start_date, end_date]
-            
-            # get client_id from combo box
-            if client_id is None:
-                client_id = self.client_combo.currentData()
-                
-            if client_id and client_id != "all":
-                query += " AND c.client_id = %s"
-                params.append(client_id)
-            
-            # Add sorting
-            query += " ORDER BY c.date, c.client_id"
-            
-            print(f"Executing query: {query}\nWith params: {params}")
-            cursor.execute(query, params)
-            result_columns = [desc[0] for desc in cursor.description]
-            rows = cursor.fetchall()
-            
-            print(f"Found {len(rows)} records")
-            if rows:
-                print(f"Sample row: {rows[0]}")
-            
-            df = pd.DataFrame(rows, columns=result_columns)
-            
-            if df.empty:
-                print("No client statistics data found")
-                return pd.DataFrame()
-            
-            return df
-            
-        except Exception as e:
-            error_msg = f"Failed to load client statistics data: {e}\n\n{traceback.format_exc()}"
-            print(error_msg)
-            QMessageBox.warning(self, "Error", f"Error loading client statistics data: {str(e)}")
-            return pd.DataFrame()
-        finally:
-            if cursor:
-                cursor.close()
+        if self._clients_cache is not None:
+            self.load_clients(conn)
+            self.load_devices(conn, client_id)
+            return
+
+        # Start new transaction
+        conn.rollback()
+        cursor = conn.cursor()
+
+        query = """
+            SELECT 'client' AS kind, c.client_id, c.client_name,
+                   NULL::SMALLINT AS device_index, NULL::VARCHAR AS device_name
+            FROM (
+                SELECT DISTINCT ga.client_id, ga.client_name
+                FROM gpu_assets ga
+                WHERE ga.client_id IS NOT NULL
+            ) c
+            UNION ALL
+            SELECT 'device', d.client_id, d.client_name, d.device_index, d.device_name
+            FROM (
+                SELECT DISTINCT dd.device_index, dd.device_name, dd.client_id, g.client_name
+                FROM device_daily_stats dd
+                LEFT JOIN gpu_assets g ON dd.client_id = g.client_id
+        """
+        params = []
+        if client_id and client_id != "all":
+            query += " WHERE dd.client_id = %s"
+            params.append(client_id)
+        query += """
+            ) d
+            ORDER BY kind, client_name, client_id, device_index
+        """
+
+        # one stable shape per filter presence; re-executions skip
+        # server-side parse/plan
+        shape = "combo_lists_c" if params else "combo_lists"
+        self._execute_prepared(cursor, shape, query, params)
+
+        client_rows = []
+        device_rows = []
+        for kind, row_client_id, client_name, device_index, device_name in cursor.fetchall():
+            if kind == 'client':
+                client_rows.append((row_client_id, client_name))
+            else:
+                device_rows.append((device_index, device_name, row_client_id, client_name))
+
+        if client_rows:
+            self._clients_cache = client_rows
+            self._populate_client_combo(client_rows)
+        else:
+            # gpu_assets is empty; fall back to the client_daily_stats path
+            self.load_clients(conn)
+
+        self._populate_device_combo(device_rows)
     
-    def load_device_stats(self, conn, start_date, end_date, device_id=None, client_id=None):
-        """Load device statistics data
-        
+    def _decimate(self, pivot):
+        """Resample a date-indexed pivot when it exceeds the point budget
+
+        Matplotlib degrades badly past a few thousand points per series.
+        Daily stats only get there on very long ranges, but when they do,
+        pick the coarsest of day/week/month that fits the budget.
+
         Args:
-            conn: Database connection
-            start_date: Start date (yyyy-MM-dd)
-            end_date: End date (yyyy-MM-dd)
-            device_id: Optional device ID, if provided only load data for that device
-            client_id: Optional client ID, if provided only load device data for that client
+            pivot: DataFrame with a DatetimeIndex, one column per series
+
+        Returns:
+            pd.DataFrame: the pivot, resampled if needed
+        """
+        if len(pivot) <= self.PLOT_POINT_BUDGET:
+            return pivot
+
+        resampled = pivot
+        for rule in ('D', 'W', 'ME'):
+            resampled = pivot.resample(rule).mean()
+            if len(resampled) <= self.PLOT_POINT_BUDGET:
+                break
+        return resampled
+
+    def _plot_trunc_unit(self, start_date, end_date):
+        """Pick the date_trunc unit that keeps plotted points in budget
+
+        Long ranges are reduced server-side rather than shipping daily
+        rows only to resample them in pandas; _decimate remains as a
+        client-side safety net.
+
+        Args:
+            start_date: start date (yyyy-MM-dd)
+            end_date: end date (yyyy-MM-dd)
+
+        Returns:
+            str: 'day', 'week' or 'month'
+        """
+        days = (datetime.strptime(end_date, "%Y-%m-%d")
+                - datetime.strptime(start_date, "%Y-%m-%d")).days + 1
+        if days <= self.PLOT_POINT_BUDGET:
+            return 'day'
+        if days // 7 <= self.PLOT_POINT_BUDGET:
+            return 'week'
+        return 'month'
+
+    def _build_client_stats_query(self, start_date, end_date, client_id=None):
+        """Build the aggregated client stats query
+
+        Pre-aggregates per (date, client) so pandas receives one row per
+        plotted point, and selects only the columns the charts consume.
+
+        Returns:
+            tuple[str, list]: SQL text and parameters
+        """
+        trunc = self._plot_trunc_unit(start_date, end_date)
+        query = """
+            SELECT
+                date_trunc(%s, c.date)::timestamp AS date,
+                c.client_id,
+                g.client_name,
+                AVG(c.avg_cpu_usage) AS avg_cpu_usage,
+                AVG(c.avg_memory_usage) AS avg_memory_usage,
+                SUM(c.total_network_in_bytes) AS total_network_in_bytes,
+                SUM(c.total_network_out_bytes) AS total_network_out_bytes
+            FROM client_daily_stats c
+            LEFT JOIN gpu_assets g ON c.client_id = g.client_id
+            WHERE c.date >= %s AND c.date <= %s
+        """
+        params = [trunc, start_date, end_date]
+
+        if client_id and client_id != "all":
+            query += " AND c.client_id = %s"
+            params.append(client_id)
+
+        # GROUP BY 1: binding the trunc unit again would leave a second
+        # parameter number after the PREPARE rewrite, and PostgreSQL then
+        # no longer matches the expressions as equal
+        query += " GROUP BY 1, c.client_id, g.client_name"
+        query += " ORDER BY 1, c.client_id"
+        return query, params
+
+    def _build_device_stats_query(self, start_date, end_date, device_id=None, client_id=None):
+        """Build the aggregated device stats query
+
+        Reads from the dashboard_device_daily materialized view, averaging
+        per (date, device) so pandas receives one row per plotted point.
+        Only plotted metric columns that actually exist are selected, using
+        the column set detected at startup.
+
+        Returns:
+            tuple[str, list]: SQL text and parameters
+        """
+        columns = self._device_metric_cols
+        trunc = self._plot_trunc_unit(start_date, end_date)
+
+        # Cast to timestamp server-side so the frame arrives datetime64[ns]
+        # and plotting never re-parses date strings
+        select_columns = ["date_trunc(%s, d.date)::timestamp AS date",
+                          "d.device_index", "d.device_name"]
+
+        # Add metric columns consumed by the charts (if they exist)
+        metrics = {
+            'avg_utilization': 'avg_utilization',
+            'avg_temperature': 'avg_temperature'
+        }
+
+        for metric_col, alias in metrics.items():
+            if metric_col in columns:
+                select_columns.append(f"AVG(d.{metric_col}) AS {alias}")
+
+        query = f"""
+            SELECT {', '.join(select_columns)}
+            FROM dashboard_device_daily d
+            WHERE d.date >= %s AND d.date <= %s
+        """
+        params = [trunc, start_date, end_date]
+
+        if client_id and client_id != "all":
+            query += " AND d.client_id = %s"
+            params.append(client_id)
+
+        if device_id and device_id != "all":
+            query += " AND d.device_index = %s"
+            params.append(device_id)
+
+        # GROUP BY 1 for the same reason as the client query: a second
+        # bound trunc unit would not compare equal after the $n rewrite
+        query += " GROUP BY 1, d.device_index, d.device_name"
+        query += " ORDER BY 1, d.device_index"
+        return query, params
+
+    @staticmethod
+    def _records_to_dataframe(records):
+        """Build a DataFrame column-major from json_agg row objects
+
+        Transposes the row dicts into one sequence per column so pandas
+        allocates each column as its own contiguous 1D buffer (inferring
+        dtypes per column, None becoming NaN), instead of walking the
+        rows one dict at a time.
+
+        Args:
+            records: list of row dicts sharing the same keys, or None
+
+        Returns:
+            pd.DataFrame: one column per key; empty when records is empty
+        """
+        if not records:
+            return pd.DataFrame()
+        columns = list(records[0].keys())
+        cols = zip(*(record.values() for record in records))
+        return pd.DataFrame(dict(zip(columns, cols)))
+
+    def _execute_prepared(self, cursor, name, query, params):
+        """Execute a query through a per-connection prepared statement
+
+        The statement is PREPAREd (and committed, so a later rollback does
+        not discard it) the first time this connection sees the name;
+        subsequent calls just EXECUTE, skipping server-side parse/plan.
+
+        Args:
+            cursor: database cursor
+            name: prepared statement name; must be unique per SQL shape
+            query: SQL text with %s placeholders
+            params: query parameters
+        """
+        conn = cursor.connection
+        prepared = conn.prepared_statements
+
+        if name not in prepared:
+            numbered = query
+            for i in range(query.count('%s')):
+                numbered = numbered.replace('%s', f'${i + 1}', 1)
+            cursor.execute(f"PREPARE {name} AS {numbered}")
+            conn.commit()
+            prepared.add(name)
+
+        if params:
+            placeholders = ', '.join(['%s'] * len(params))
+            cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
+
+    def load_stats(self, conn, start_date, end_date, client_id=None, device_id=None):
+        """Load client and device statistics in a single round-trip
+
+        psycopg2 has no libpq pipeline mode, so the two aggregated reads
+        are combined into one CTE whose outer SELECT returns both result
+        sets as JSON arrays; the planner still optimizes each branch with
+        its own indexes.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: (client stats, device stats)
         """
         cursor = None
         try:
-            print(f"Loading device stats from {start_date} to {end_date}, device_id: {device_id}, client_id: {client_id}")
-            
             # Start new transaction
             conn.rollback()
             cursor = conn.cursor()
-            
-            # First check if table has data
-            cursor.execute("SELECT COUNT(*) FROM device_daily_stats")
-            count = cursor.fetchone()[0]
-            print(f"Total records in device_daily_stats: {count}")
-            
-            if count == 0:
-                print("No data found in device_daily_stats table")
-                return pd.DataFrame()
-            
-            # Get actual columns in table
-            cursor.execute("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'device_daily_stats'
-                ORDER BY ordinal_position
-            """)
-            columns = [row[0] for row in cursor.fetchall()]
-            print(f"Available columns in device_daily_stats: {columns}")
-            
-            # Build query using only existing columns
-            select_columns = ["d.date", "d.client_id", "d.device_index", "d.device_name", "g.client_name"]
-            
-            # Add metric columns (if they exist)
-            metrics = {
-                'avg_utilization': 'avg_utilization',
-                'avg_temperature': 'avg_temperature',
-                'avg_power_usage': 'avg_power_usage',
-                'avg_memory_usage': 'avg_memory_usage'
-            }
-            
-            for metric_col, alias in metrics.items():
-                if metric_col in columns:
-                    select_columns.append(f"d.{metric_col}")
-            
-            # Build query using LEFT JOIN to get client_name
+
+            client_sql, client_params = self._build_client_stats_query(
+                start_date, end_date, client_id)
+            device_sql, device_params = self._build_device_stats_query(
+                start_date, end_date, device_id, client_id)
+
             query = f"""
-                SELECT {', '.join(select_columns)}
-                FROM device_daily_stats d
-                LEFT JOIN gpu_assets g ON d.client_id = g.client_id
-                WHERE d.date >= %s AND d.date <= %s
+                WITH client_rows AS ({client_sql}),
+                     device_rows AS ({device_sql})
+                SELECT (SELECT json_agg(c) FROM client_rows c) AS client_rows,
+                       (SELECT json_agg(d) FROM device_rows d) AS device_rows
             """
-            
-            params = [start_date, end_date]
-            
-            # Add client filter condition
+            # One stable SQL shape per filter combination, so the server
+            # reuses the prepared plan across refreshes
+            shape = "dashboard_stats"
             if client_id and client_id != "all":
-                query += " AND d.client_id = %s"
-                params.append(client_id)
-                print(f"Filtering for client_id: {client_id}")
-                
-            # Add device filter condition
+                shape += "_c"
             if device_id and device_id != "all":
-                query += " AND d.device_index = %s"
-                params.append(device_id)
-                print(f"Filtering for device_index: {device_id}")
-            
-            print(f"Executing query: {query}\nWith params: {params}")
-            cursor.execute(query, params)
-            result_columns = [desc[0] for desc in cursor.description]
-            rows = cursor.fetchall()
-            
-            print(f"Found {len(rows)} records")
-            if rows:
-                print(f"Sample row: {rows[0]}")
-            
-            df = pd.DataFrame(rows, columns=result_columns)
-            
-            if df.empty:
-                print("No device statistics data found")
-                return pd.DataFrame()
-                
-            return df
-            
-        except Exception as e:
-            error_msg = f"Failed to load device statistics data: {e}\n\n{traceback.format_exc()}"
-            print(error_msg)
-            QMessageBox.warning(self, "Error", f"Error loading device statistics data: {str(e)}")
-            return pd.DataFrame()
+                shape += "_d"
+            self._execute_prepared(cursor, shape, query, client_params + device_params)
+            client_rows, device_rows = cursor.fetchone()
+
+            client_df = self._records_to_dataframe(client_rows)
+            device_df = self._records_to_dataframe(device_rows)
+
+            for df in (client_df, device_df):
+                if 'date' in df.columns:
+                    df['date'] = pd.DatetimeIndex(df['date'])
+
+            # JSON serializes BYTEA as \x-prefixed hex text; restore bytes
+            # so the label code can keep calling .hex()
+            if not client_df.empty:
+                client_df['client_id'] = client_df['client_id'].str[2:].map(bytes.fromhex)
+
+            return client_df, device_df
         finally:
             if cursor:
                 cursor.close()
-                
-    def plot_device_stats(self, df):
-        """Plot device statistics charts
-        
-        Args:
-            df: DataFrame containing device statistics data
-        """
-        try:
-            if df.empty:
-                print("No device data to plot")
-                return
-                
-            # Clear existing charts
-            self.device_figure.clear()
-            
-            # Set Chinese font
-            plt.rcParams['font.sans-serif'] = ['Arial Unicode MS']
-            plt.rcParams['axes.unicode_minus'] = False
-            
-            # Create subplots
-            ax1 = self.device_figure.add_subplot(311)
-            ax2 = self.device_figure.add_subplot(312)
-            ax3 = self.device_figure.add_subplot(313)
-            
-            # convert date to datetime
-            df['date'] = pd.to_datetime(df['date'])
-            
-            # Group by date and device
-            if 'device_name' in df.columns:
-                group_cols = ['date', 'device_name']
-            else:
-                group_cols = ['date']
-                
-            grouped = df.groupby(group_cols).mean().reset_index()
-            
-            # Plot utilization chart
-            if 'avg_utilization' in df.columns:
-                if 'device_name' in df.columns:
-                    for name, group in grouped.groupby('device_name'):
-                        ax1.plot(group['date'], group['avg_utilization'], 'o-', label=name)
-                    ax1.legend()
-                else:
-                    ax1.plot(grouped['date'], grouped['avg_utilization'], 'o-')
-                ax1.set_ylabel('GPU utilization (%)')
-                ax1.set_title('GPU avg utilization')
-                ax1.grid(True)
-            
-            # Plot temperature chart
-            if 'avg_temperature' in df.columns:
-                if 'device_name' in df.columns:
-                    for name, group in grouped.groupby('device_name'):
-                        ax2.plot(group['date'], group['avg_temperature'], 'o-', label=name)
-                else:
-                    ax2.plot(grouped['date'], grouped['avg_temperature'], 'o-')
-                ax2.set_ylabel('temperature (°C)')
-                ax2.set_title('GPU avg temperature')
-                ax2.grid(True)
-            
-            # Plot memory usage chart
-            if 'avg_memory_usage' in df.columns:
-                if 'device_name' in df.columns:
-                    for name, group in grouped.groupby('device_name'):
-                        ax3.plot(group['date'], group['avg_memory_usage'], 'o-', label=name)
-                else:
-                    ax3.plot(grouped['date'], grouped['avg_memory_usage'], 'o-')
-                ax3.set_ylabel('memory usage (MB)')
-                ax3.set_title('GPU avg memory usage')
-                ax3.grid(True)
-            
-            # adjust layout
-            self.device_figure.tight_layout()
-            
-            # Redraw canvas
-            self.device_canvas.draw()
-            
-        except Exception as e:
-            error_msg = f"Error plotting device statistics charts: {e}\n\n{traceback.format_exc()}"
-            print(error_msg)
-            QMessageBox.warning(self, "Error", f"Error plotting device statistics charts: {str(e)}")
-    
-    def load_table_data(self, conn, start_date, end_date, data_type='client', filter_id=None):
-        """load table data
+
+    def load_table_data(self, start_date, end_date, data_type='client', filter_id=None):
+        """Load table data on a pool thread
+
+        The combo selections are read here on the GUI thread, then the
+        query streams on a worker and the chunks come back through
+        signals, so the UI stays responsive while the table fills.
 
         Args:
-            conn: database connection
             start_date: start date (yyyy-MM-dd)
             end_date: end date (yyyy-MM-dd)
             data_type: data type, 'client' or 'device'
             filter_id: optional filter ID, client ID or device index
         """
-        cursor = conn.cursor()
-        
         try:
             if data_type == 'client':
                 query = """
@@ -814,14 +1252,14 @@ class StatsDashboard(QMainWindow):
                 # add client filter condition
                 if filter_id is None:
                     filter_id = self.client_combo.currentData()
-                    
+
                 if filter_id and filter_id != "all":
                     query += " AND c.client_id = %s"
                     params.append(filter_id)
-                
+
                 # sort
                 query += " ORDER BY c.date DESC, c.client_id"
-                
+
             else:  # device stat
                 query = """
                     SELECT 
@@ -845,445 +1283,609 @@ class StatsDashboard(QMainWindow):
                 if client_id and client_id != "all":
                     query += " AND d.client_id = %s"
                     params.append(client_id)
-                
+
                 # add device filter condition
                 if filter_id is None:
                     filter_id = self.device_combo.currentData()
-                    
+
                 if filter_id and filter_id != "all":
                     query += " AND d.device_index = %s"
                     params.append(filter_id)
-                
+
                 # sort
                 query += " ORDER BY d.date DESC, d.client_id, d.device_index"
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
-            
-            # update table
-            self.update_table(rows, columns)
-            
+
+            self._submit_table_task(query, params)
+
         except Exception as e:
             error_msg = f"Failed to load table data: {e}\n\n{traceback.format_exc()}"
             print(error_msg)
             QMessageBox.critical(self, "Error", error_msg)
-    
+
+    def _submit_table_task(self, query, params):
+        """Submit the table query to the global thread pool
+
+        A task already in flight is marked cancelled so its (stale)
+        chunks are dropped when they eventually arrive.
+        """
+        if self._current_table_task:
+            self._current_table_task.cancelled = True
+
+        task = TableQueryTask(self, query, params)
+        # every slot checks the emitting task's identity: a superseded
+        # task only polls cancelled between chunks, so a final chunk can
+        # still arrive after its replacement has reset the model
+        task.signals.columns.connect(
+            lambda columns, task=task: self._on_table_columns(task, columns))
+        task.signals.rows.connect(
+            lambda rows, task=task: self._on_table_rows(task, rows))
+        task.signals.finished.connect(
+            lambda task=task: self._on_table_finished(task))
+        task.signals.failed.connect(
+            lambda message, task=task: self._on_table_failed(task, message))
+        self._current_table_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_table_columns(self, task, columns):
+        """Start filling the model, ignoring superseded tasks"""
+        if task is self._current_table_task:
+            self.table_model.begin_rows(columns)
+
+    def _on_table_rows(self, task, rows):
+        """Append a streamed chunk, ignoring superseded tasks"""
+        if task is self._current_table_task:
+            self.table_model.append_rows(rows)
+
+    def _on_table_finished(self, task):
+        """Finish a streamed table load (runs on the GUI thread)"""
+        if task is not self._current_table_task:
+            return
+        self._current_table_task = None
+        # size columns once, after all rows are in
+        self.data_table.resizeColumnsToContents()
+
+    def _on_table_failed(self, task, message):
+        """Report a failed table query (runs on the GUI thread)"""
+        if task is not self._current_table_task:
+            return
+        self._current_table_task = None
+        QMessageBox.critical(self, "Error", f"Failed to load table data: {message}")
+
     def update_table(self, rows, columns):
         """Update table data"""
-        self.data_table.clear()
-        self.data_table.setColumnCount(len(columns))
-        self.data_table.setRowCount(len(rows))
-        
-        # set table header
-        self.data_table.setHorizontalHeaderLabels(columns)
-        
-        # fill data
-        for row_idx, row in enumerate(rows):
-            for col_idx, value in enumerate(row):
-                if value is None:
-                    item = QTableWidgetItem("")
-                else:
-                    item = QTableWidgetItem(str(value))
-                
-                # set cell to be non-editable
-                item.setFlags(item.flags() ^ Qt.ItemIsEditable)
-                self.data_table.setItem(row_idx, col_idx, item)
-        
-        # adjust column width
-        self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # a direct reset supersedes any in-flight streamed load; left
+        # current, its remaining chunks would pass the identity check
+        # and repopulate the just-cleared table
+        if self._current_table_task:
+            self._current_table_task.cancelled = True
+            self._current_table_task = None
+
+        self.data_table.setUpdatesEnabled(False)
+        try:
+            self.table_model.set_rows(rows, columns)
+        finally:
+            self.data_table.setUpdatesEnabled(True)
+
+        # size columns once per reset instead of rescanning on every change
+        self.data_table.resizeColumnsToContents()
     
     def plot_client_stats(self, df):
-        """Plot client statistics charts"""
+        """Plot client statistics charts
+
+        Reuses the Axes created in init_ui; each metric is one batched
+        LineCollection whose segments are swapped in place on refresh.
+        """
         try:
-            # clear previous charts
-            self.client_figure.clear()
-            
-            if df.empty or df is None:
+            ax1, ax2 = self.client_axes
+            ax1_twin, ax2_twin = self.client_twin_axes
+
+            if df is None or df.empty:
                 print("No available client statistics data")
-                # add placeholder text
-                ax = self.client_figure.add_subplot(111)
-                ax.text(0.5, 0.5, 'No available client statistics data',
+                # show placeholder in chart area
+                self._reset_client_axes()
+                ax1.text(0.5, 0.5, 'No available client statistics data',
                        horizontalalignment='center',
                        verticalalignment='center',
-                       transform=ax.transAxes,
+                       transform=ax1.transAxes,
                        fontsize=12)
-                ax.axis('off')
-                self.client_canvas.draw()
+                for ax in (ax1, ax1_twin, ax2, ax2_twin):
+                    ax.axis('off')
+                self._client_placeholder = True
+                self.client_canvas.draw_idle()
                 return
+
+            # a previous placeholder switched the axes off; start clean
+            if self._client_placeholder:
+                self._reset_client_axes()
         
             # convert date format
             df['date'] = pd.to_datetime(df['date'])
-            
-            # create client label column
+
+            # plot in float32: halves the bytes Matplotlib walks per draw
+            for c in ('avg_cpu_usage', 'avg_memory_usage'):
+                if c in df.columns:
+                    df[c] = df[c].astype('float32', copy=False)
+            
+            # create client label column (vectorized; no per-row apply).
+            # hex only each distinct id once, then map it over the rows
+            if 'client_id' in df.columns:
+                hex_map = {b: b.hex()[:8]
+                           for b in df['client_id'].drop_duplicates()}
+                hex8 = df['client_id'].map(hex_map)
             if 'client_name' in df.columns and 'client_id' in df.columns:
-                df['client_label'] = df.apply(
-                    lambda x: f"{x['client_name']} ({x['client_id'].hex()[:8]}...)" 
-                             if pd.notna(x['client_name']) and x['client_name'] 
-                             else f"Client {x['client_id'].hex()[:8]}...",
-                    axis=1
+                df['client_label'] = np.where(
+                    df['client_name'].notna() & df['client_name'].astype(bool),
+                    df['client_name'].astype(str) + ' (' + hex8 + '...)',
+                    'Client ' + hex8 + '...'
                 )
             elif 'client_id' in df.columns:
-                df['client_label'] = df['client_id'].apply(lambda x: f"Client {x.hex()[:8]}...")
+                df['client_label'] = 'Client ' + hex8 + '...'
             else:
                 return  # no available client identifier
         
-            # create 2x1 subplot layout (vertical arrangement)
-            self.client_figure.clear()  # clear previous charts
-            
-            # create first subplot: CPU and memory usage
-            ax1 = self.client_figure.add_subplot(211)
-            
-            # Plot CPU and memory usage in the same chart
+            # derive the network MB columns once, as a reciprocal multiply
+            # on the raw arrays (cheaper than per-element division)
+            bytes_to_mb = np.float32(1.0 / (1024 * 1024))
+            mb_cols = {}
+            if 'total_network_in_bytes' in df.columns:
+                mb_cols['total_network_in_mb'] = (
+                    df['total_network_in_bytes'].values.astype(np.float32) * bytes_to_mb)
+            if 'total_network_out_bytes' in df.columns:
+                mb_cols['total_network_out_mb'] = (
+                    df['total_network_out_bytes'].values.astype(np.float32) * bytes_to_mb)
+            if mb_cols:
+                df = df.assign(**mb_cols)
+
+            # one pivot for every plotted metric; the per-metric frames
+            # below are column slices of it
+            metric_cols = [c for c in ('avg_cpu_usage', 'avg_memory_usage',
+                                       'total_network_in_mb', 'total_network_out_mb')
+                           if c in df.columns]
+            pivot_all = (df.pivot(index='date', columns='client_label', values=metric_cols)
+                         if metric_cols else None)
+
+            # Plot CPU and memory usage in the same chart, updating the
+            # persistent axes in place and tracking touched series
             has_cpu_data = 'avg_cpu_usage' in df.columns
             has_memory_data = 'avg_memory_usage' in df.columns
-        
+
+            updated = set()
+
             if has_cpu_data or has_memory_data:
-                # Create dual-axis chart
-                ax1_twin = ax1.twinx()
-                
-                # Pre-calculate pivot data
-                pivot_cpu = None
-                pivot_mem = None
-            
                 # Define color schemes for CPU and memory
                 cpu_colors = ['#1f77b4', '#3498db', '#5dade2', '#85c1e9']  # Blue series
                 mem_colors = ['#e74c3c', '#ec7063', '#f1948a', '#f5b7b1']  # Red series
-                
+                cpu_handles, mem_handles = [], []
+
                 # Plot CPU usage (left axis)
                 if has_cpu_data:
-                    pivot_cpu = df.pivot(index='date', columns='client_label', values='avg_cpu_usage')
-                    lines_cpu = []
-                    for i, column in enumerate(pivot_cpu.columns):
-                        color_idx = i % len(cpu_colors)
-                        line, = ax1.plot(pivot_cpu.index, pivot_cpu[column], 
-                                       color=cpu_colors[color_idx], 
-                                       marker='o', linewidth=2, markersize=6)
-                        lines_cpu.append(line)
-                        line.set_label(f'{column} (CPU)')
+                    cpu_handles = self._plot_client_series(
+                        'cpu', ax1, pivot_all['avg_cpu_usage'], cpu_colors,
+                        'CPU', marker='o', linewidth=2, markersize=6)
+                    updated.add('cpu')
                     ax1.set_ylabel('CPU Usage (%)', color=cpu_colors[0], fontweight='bold')
                     ax1.tick_params(axis='y', labelcolor=cpu_colors[0])
-                
+
                 # Plot memory usage (right axis)
                 if has_memory_data:
-                    pivot_mem = df.pivot(index='date', columns='client_label', values='avg_memory_usage')
-                    lines_mem = []
-                    for i, column in enumerate(pivot_mem.columns):
-                        color_idx = i % len(mem_colors)
-                        line, = ax1_twin.plot(pivot_mem.index, pivot_mem[column], 
-                                            color=mem_colors[color_idx],
-                                            marker='s', linewidth=2, markersize=5, 
-                                            alpha=0.9)
-                        lines_mem.append(line)
-                        line.set_label(f'{column} (Memory)')
+                    mem_handles = self._plot_client_series(
+                        'mem', ax1_twin, pivot_all['avg_memory_usage'], mem_colors,
+                        'Memory', marker='s', linewidth=2, markersize=5,
+                        alpha=0.9)
+                    updated.add('mem')
                     ax1_twin.set_ylabel('Memory Usage (%)', color=mem_colors[0], fontweight='bold')
                     ax1_twin.tick_params(axis='y', labelcolor=mem_colors[0])
-                
+
                 ax1.set_title('CPU and Memory Average Usage (%)')
                 ax1.set_xlabel('')
                 ax1.grid(True)
-                
-                # Merge legends
-                lines1, labels1 = ax1.get_legend_handles_labels()
-                lines2, labels2 = ax1_twin.get_legend_handles_labels()
-                ax1.legend(lines1 + lines2, labels1 + labels2, title='Client', loc='upper right')
+
+                # Merge legends (collections carry no per-client labels,
+                # so the proxy handles stand in for them)
+                ax1.legend(handles=cpu_handles + mem_handles, title='Client', loc='upper right')
             else:
+                ax1.clear()
                 ax1.text(0.5, 0.5, 'No CPU or memory usage data available',
                         horizontalalignment='center', verticalalignment='center',
                         transform=ax1.transAxes)
-        
-            # Create second subplot: Network traffic statistics
-            ax2 = self.client_figure.add_subplot(212)
-            
+
             # Plot network traffic statistics
             has_network_in = 'total_network_in_bytes' in df.columns
             has_network_out = 'total_network_out_bytes' in df.columns
-            
+
             if has_network_in or has_network_out:
-                # create twin axis for network traffic
-                ax2_twin = ax2.twinx()
-                
-                # percolate pivot data
-                pivot_network_in = None
-                pivot_network_out = None
-                
                 # set color
                 in_colors = ['#2ecc71', '#58d68d', '#82e0aa', '#abebc6']  # Green series
                 out_colors = ['#e67e22', '#eb984e', '#f0b27a', '#f5cba7']  # Orange series
-                
-                # plot network in
+                in_handles, out_handles = [], []
+
+                # plot network in (left axis)
                 if has_network_in:
-                    df_plot = df.copy()
-                    df_plot['total_network_in_mb'] = df['total_network_in_bytes'] / (1024 * 1024)
-                    pivot_network_in = df_plot.pivot(index='date', columns='client_label', values='total_network_in_mb')
-                    lines_in = []
-                    for i, column in enumerate(pivot_network_in.columns):
-                        color_idx = i % len(in_colors)
-                        line, = ax2.plot(pivot_network_in.index, pivot_network_in[column], 
-                                       color=in_colors[color_idx],
-                                       marker='o', linewidth=2, markersize=6)
-                        lines_in.append(line)
-                        line.set_label(f'{column} (in)')
+                    in_handles = self._plot_client_series(
+                        'in', ax2, pivot_all['total_network_in_mb'], in_colors,
+                        'in', marker='o', linewidth=2, markersize=6)
+                    updated.add('in')
                     ax2.set_ylabel('Network In (MB)', color=in_colors[0], fontweight='bold')
                     ax2.tick_params(axis='y', labelcolor=in_colors[0])
-                
-                # plot network out
+
+                # plot network out (right axis)
                 if has_network_out:
-                    df_plot = df.copy()
-                    df_plot['total_network_out_mb'] = df['total_network_out_bytes'] / (1024 * 1024)
-                    pivot_network_out = df_plot.pivot(index='date', columns='client_label', values='total_network_out_mb')
-                    lines_out = []
-                    for i, column in enumerate(pivot_network_out.columns):
-                        color_idx = i % len(out_colors)
-                        line, = ax2_twin.plot(pivot_network_out.index, pivot_network_out[column], 
-                                            color=out_colors[color_idx],
-                                            marker='s', linewidth=2, markersize=5, 
-                                            alpha=0.9)
-                        lines_out.append(line)
-                        line.set_label(f'{column} (out)')
+                    out_handles = self._plot_client_series(
+                        'out', ax2_twin, pivot_all['total_network_out_mb'], out_colors,
+                        'out', marker='s', linewidth=2, markersize=5,
+                        alpha=0.9)
+                    updated.add('out')
                     ax2_twin.set_ylabel('Network Out (MB)', color=out_colors[0], fontweight='bold')
                     ax2_twin.tick_params(axis='y', labelcolor=out_colors[0])
-                
+
                 ax2.set_title('Network Traffic (MB)')
                 ax2.set_xlabel('Date')
                 ax2.grid(True)
-                
+
                 # merge legend
-                lines1, labels1 = ax2.get_legend_handles_labels()
-                lines2, labels2 = ax2_twin.get_legend_handles_labels()
-                ax2.legend(lines1 + lines2, labels1 + labels2, title='Client', loc='upper right')
+                ax2.legend(handles=in_handles + out_handles, title='Client', loc='upper right')
             else:
+                ax2.clear()
                 ax2.text(0.5, 0.5, 'No available network traffic data',
                         horizontalalignment='center', verticalalignment='center',
                         transform=ax2.transAxes)
-            
-            # adjust layout
+
+            # drop collections for metrics absent from this frame
+            for key in list(self._client_collections):
+                if key not in updated:
+                    lc, markers = self._client_collections.pop(key)
+                    for artist in (lc, markers):
+                        if artist.axes is not None:
+                            artist.remove()
+
+            # data limits were rebuilt per metric in _plot_client_series
+            for ax in (ax1, ax1_twin, ax2, ax2_twin):
+                ax.autoscale_view()
+
+            # adjust layout; the caller coalesces the redraw via draw_idle
             self.client_figure.tight_layout()
-            
-            # force redraw
-        
+
         except Exception as e:
             print(f"Error plotting client stats: {e}")
             traceback.print_exc()
             # show error in chart area
             try:
-                self.client_figure.clear()
-                ax = self.client_figure.add_subplot(111)
-                ax.text(0.5, 0.5, f'Error plotting client stats: {str(e)}',
+                self._reset_client_axes()
+                ax1, _ = self.client_axes
+                ax1.text(0.5, 0.5, f'Error plotting client stats: {str(e)}',
                        horizontalalignment='center',
                        verticalalignment='center',
-                       transform=ax.transAxes,
+                       transform=ax1.transAxes,
                        color='red')
-                ax.axis('off')
-                self.client_canvas.draw()
+                for ax in self.client_axes + self.client_twin_axes:
+                    ax.axis('off')
+                self._client_placeholder = True
+                self.client_canvas.draw_idle()
             except:
                 pass
     
+    def _reset_client_axes(self):
+        """Clear the client axes (and twins) and forget their collections"""
+        for ax in self.client_axes + self.client_twin_axes:
+            ax.clear()
+            ax.axis('on')
+        self._client_collections.clear()
+        self._client_placeholder = False
+
+    def _plot_client_series(self, metric_key, ax, pivot, colors, label_suffix,
+                            marker='o', linewidth=2, markersize=6, alpha=None):
+        """Update one client metric as a single batched LineCollection
+
+        Every client's line for a metric lives in one LineCollection (plus
+        one scatter for the markers), so Agg receives one path submission
+        per metric instead of one Line2D dispatch per client.
+
+        Args:
+            metric_key: short key identifying the metric/axis pair
+            ax: the Axes (or twin) the metric draws on
+            pivot: date-indexed frame, one column per client label
+            colors: color cycle for the per-client segments
+            label_suffix: legend suffix, e.g. 'CPU'
+            marker, linewidth, markersize, alpha: shared series style
+
+        Returns:
+            list: proxy Line2D handles for the legend, one per client
+        """
+        pivot = self._decimate(pivot)
+        x = mdates.date2num(pivot.index)
+        seg_colors = [colors[i % len(colors)]
+                      for i in range(len(pivot.columns))]
+        segs = [np.column_stack([x, pivot[column].to_numpy(dtype=float)])
+                for column in pivot.columns]
+        pts = np.concatenate(segs) if segs else np.empty((0, 2))
+
+        artists = self._client_collections.get(metric_key)
+        if artists is None:
+            lc = LineCollection(segs, colors=seg_colors,
+                                linewidths=linewidth, alpha=alpha)
+            ax.add_collection(lc, autolim=False)
+            markers = ax.scatter([], [], marker=marker, s=markersize ** 2,
+                                 alpha=alpha)
+            ax.xaxis_date()
+            self._client_collections[metric_key] = (lc, markers)
+        else:
+            lc, markers = artists
+            lc.set_segments(segs)
+            lc.set_color(seg_colors)
+
+        # one marker per vertex, colored by its segment
+        markers.set_offsets(pts)
+        markers.set_facecolor(np.repeat(seg_colors, len(x)) if segs else [])
+
+        # collections don't feed relim(); rebuild the data limits from the
+        # finite vertices so autoscale_view tracks shrinking data too
+        ax.relim()
+        finite = np.isfinite(pts).all(axis=1)
+        if finite.any():
+            ax.update_datalim(pts[finite])
+
+        return [Line2D([], [], color=color, marker=marker,
+                       linewidth=linewidth, markersize=markersize,
+                       alpha=alpha, label=f'{column} ({label_suffix})')
+                for column, color in zip(pivot.columns, seg_colors)]
+
+    def _on_device_draw(self, event):
+        """After every full render, cache the background and blit the lines
+
+        The cached lines are animated artists, so the renderer skipped
+        them; draw them on top here and remember the clean background for
+        later data-only updates.
+        """
+        self._device_bg = self.device_canvas.copy_from_bbox(self.device_figure.bbox)
+        self._blit_device_lines()
+
+    def _blit_device_lines(self):
+        """Draw the cached device lines and blit the figure region"""
+        for line in self._device_lines.values():
+            line.axes.draw_artist(line)
+        self.device_canvas.blit(self.device_figure.bbox)
+
+    def _reset_device_axes(self):
+        """Clear both device axes and forget their cached lines"""
+        for ax in self.device_axes:
+            ax.clear()
+            ax.axis('on')
+        self._device_lines.clear()
+        self._device_placeholder = False
+
+    def _plot_device_metric(self, ax_key, ax, df, metric, title, ylabel, missing_text):
+        """Update one device subplot in place, reusing Line2D artists
+
+        Returns:
+            set: the (ax_key, device label) keys touched by this call
+        """
+        updated = set()
+
+        if metric not in df.columns:
+            # metric column missing entirely; show placeholder text
+            for key in [k for k in self._device_lines if k[0] == ax_key]:
+                del self._device_lines[key]
+            ax.clear()
+            ax.text(0.5, 0.5, missing_text,
+                    horizontalalignment='center', verticalalignment='center',
+                    transform=ax.transAxes)
+            return updated
+
+        pivot = self._decimate(df.pivot(index='date', columns='device_label', values=metric))
+        for column in pivot.columns:
+            key = (ax_key, column)
+            line = self._device_lines.get(key)
+            if line is None:
+                line, = ax.plot(pivot.index, pivot[column], marker='o', label=str(column))
+                line.set_animated(True)
+                self._device_lines[key] = line
+            else:
+                line.set_data(pivot.index, pivot[column])
+            updated.add(key)
+
+        ax.set_title(title)
+        ax.set_ylabel(ylabel)
+        ax.grid(True)
+        ax.legend(title='Device')
+        return updated
+
     def plot_device_stats(self, df):
-        """Plot device stats"""
-        self.device_figure.clear()
-        
-        if df.empty:
-            # show error in chart area
-            ax = self.device_figure.add_subplot(111)
-            ax.text(0.5, 0.5, 'No available device statistics data',
-                   horizontalalignment='center',
-                   verticalalignment='center',
-                   transform=ax.transAxes,
-                   fontsize=12)
-            ax.axis('off')
-            self.device_canvas.draw()
+        """Plot device stats
+
+        Reuses the Axes created in init_ui and updates Line2D data in
+        place; artists are only created for newly appearing devices.
+        """
+        ax1, ax2 = self.device_axes
+
+        if df is None or df.empty:
+            # show placeholder in chart area
+            self._reset_device_axes()
+            ax1.text(0.5, 0.5, 'No available device statistics data',
+                     horizontalalignment='center',
+                     verticalalignment='center',
+                     transform=ax1.transAxes,
+                     fontsize=12)
+            ax1.axis('off')
+            ax2.axis('off')
+            self._device_placeholder = True
+            self.device_canvas.draw_idle()
             return
-        
-        # convert date format
-        df['date'] = pd.to_datetime(df['date'])
-        
-        # create device label column
+
+        # a previous placeholder switched the axes off; start clean
+        if self._device_placeholder:
+            self._reset_device_axes()
+
+        # date is already datetime64[ns]: the query casts to timestamp and
+        # the loaders parse it at frame-construction time
+
+        # plot in float32: halves the bytes Matplotlib walks per draw
+        for c in ('avg_utilization', 'avg_temperature'):
+            if c in df.columns:
+                df[c] = df[c].astype('float32', copy=False)
+
+        # create device label column (vectorized; no per-row apply)
         if 'device_name' in df.columns and 'device_index' in df.columns:
-            df['device_label'] = df.apply(
-                lambda x: f"{x['device_name']} (device {x['device_index']})" 
-                         if pd.notna(x['device_name']) and x['device_name'] else f"Device {x['device_index']}", 
-                axis=1
+            idx_str = df['device_index'].astype(str)
+            df['device_label'] = np.where(
+                df['device_name'].notna() & df['device_name'].astype(bool),
+                df['device_name'].astype(str) + ' (device ' + idx_str + ')',
+                'Device ' + idx_str
             )
         elif 'device_index' in df.columns:
-            df['device_label'] = df['device_index'].apply(lambda x: f"device {x}")
+            df['device_label'] = 'device ' + df['device_index'].astype(str)
         else:
             return  # no available device identifier
-        
-        # create subplots
-        ax1 = self.device_figure.add_subplot(211)
-        ax2 = self.device_figure.add_subplot(212)
-        
-        # plot GPU utilization
-        if 'avg_utilization' in df.columns:
-            pivot_util = df.pivot(index='date', columns='device_label', values='avg_utilization')
-            pivot_util.plot(ax=ax1, marker='o')
-            ax1.set_title('GPU Average Utilization (%)')
-            ax1.set_ylabel('Utilization (%)')
-            ax1.grid(True)
-            ax1.legend(title='Device')
-        else:
-            ax1.text(0.5, 0.5, 'No available utilization data', 
-                    horizontalalignment='center', verticalalignment='center',
-                    transform=ax1.transAxes)
-        
-        # plot GPU temperature
-        if 'avg_temperature' in df.columns:
-            pivot_temp = df.pivot(index='date', columns='device_label', values='avg_temperature')
-            pivot_temp.plot(ax=ax2, marker='o')
-            ax2.set_title('GPU Average Temperature (°C)')
-            ax2.set_ylabel('Temperature (°C)')
-            ax2.grid(True)
-            ax2.legend(title='Device')
+
+        # plot GPU utilization and temperature, tracking touched series
+        prev_keys = set(self._device_lines)
+        prev_limits = [(ax.get_xlim(), ax.get_ylim()) for ax in self.device_axes]
+
+        updated = self._plot_device_metric(
+            'util', ax1, df, 'avg_utilization',
+            'GPU Average Utilization (%)', 'Utilization (%)',
+            'No available utilization data')
+        updated |= self._plot_device_metric(
+            'temp', ax2, df, 'avg_temperature',
+            'GPU Average Temperature (°C)', 'Temperature (°C)',
+            'No available temperature data')
+
+        # drop series that disappeared from the current selection
+        for key in list(self._device_lines):
+            if key not in updated:
+                self._device_lines.pop(key).remove()
+
+        for ax in (ax1, ax2):
+            ax.relim()
+            ax.autoscale_view()
+
+        limits = [(ax.get_xlim(), ax.get_ylim()) for ax in self.device_axes]
+        structure_changed = (set(self._device_lines) != prev_keys
+                             or limits != prev_limits)
+
+        if structure_changed or self._device_bg is None:
+            # artists or axes changed; full (coalesced) redraw, which also
+            # recaptures the blit background via _on_device_draw
+            self.device_figure.tight_layout()
+            self.device_canvas.draw_idle()
         else:
-            ax2.text(0.5, 0.5, 'No available temperature data', 
-                    horizontalalignment='center', verticalalignment='center',
-                    transform=ax2.transAxes)
-        
-        # adjust layout
-        self.device_figure.tight_layout()
-        self.device_canvas.draw()
+            # data-only update: restore the cached background and blit
+            # just the lines, skipping axis/tick re-rendering
+            self.device_canvas.restore_region(self._device_bg)
+            self._blit_device_lines()
     
     def export_data(self):
-        """Export data to CSV file"""
+        """Export data to CSV file
+
+        Streams the result server-side with COPY ... TO STDOUT straight
+        into the chosen file, so exports never materialize a DataFrame
+        (or the whole result set) in memory first.
+        """
+        import os
         try:
-            # get current tab data
+            # build the current tab's query
             if self.tabs.currentIndex() == 0:  # client stats
-                df = self.get_client_data()
+                query, params = self._build_client_export_query()
                 default_filename = f"client_stats_{datetime.now().strftime('%Y%m%d')}.csv"
             else:  # device stats
-                df = self.get_device_data()
+                query, params = self._build_device_export_query()
                 default_filename = f"device_stats_{datetime.now().strftime('%Y%m%d')}.csv"
-            
-            # save to file
-            if df is not None and not df.empty:
-                filename, _ = QFileDialog.getSaveFileName(
-                    self, "Save File", default_filename, "CSV Files (*.csv)")
-                
-                if filename:
-                    df.to_csv(filename, index=False, encoding='utf-8')
-                    QMessageBox.information(self, "Export Success", f"Data exported successfully to:\n{filename}")
-            else:
+
+            filename, _ = QFileDialog.getSaveFileName(
+                self, "Save File", default_filename, "CSV Files (*.csv)")
+            if not filename:
+                return
+
+            with self.db() as conn:
+                if not conn:
+                    return
+
+                cursor = conn.cursor()
+                sql = cursor.mogrify(query, params).decode()
+                with open(filename, 'wb') as f:
+                    cursor.copy_expert(
+                        f"COPY ({sql}) TO STDOUT WITH CSV HEADER", f)
+                exported_rows = cursor.rowcount
+
+            if exported_rows == 0:
+                # only the header was written; don't leave a stub behind
+                os.remove(filename)
                 QMessageBox.warning(self, "Data Empty", "No data to export")
-            
+            else:
+                QMessageBox.information(self, "Export Success", f"Data exported successfully to:\n{filename}")
+
         except Exception as e:
             error_msg = f"Export failed: {str(e)}\n\n{traceback.format_exc()}"
             print(error_msg)
             QMessageBox.critical(self, "Export Failed", error_msg)
-    
-    def get_client_data(self):
-        """Get client stats data"""
-        conn = None
-        try:
-            conn = self.get_db_connection()
-            if not conn:
-                return None
-            
-            start_date = self.start_date.date().toString("yyyy-MM-dd")
-            end_date = self.end_date.date().addDays(1).toString("yyyy-MM-dd")
-            
-            cursor = conn.cursor()
-            
-            query = """
-                SELECT 
-                    c.date,
-                    c.client_id,
-                    g.client_name,
-                    c.total_heartbeats,
-                    c.avg_cpu_usage,
-                    c.avg_memory_usage,
-                    c.avg_disk_usage,
-                    c.total_network_in_bytes,
-                    c.total_network_out_bytes
-                FROM client_daily_stats c
-                LEFT JOIN gpu_assets g ON c.client_id = g.client_id
-                WHERE c.date >= %s AND c.date <= %s
-            """
-            params = [start_date, end_date]
-            
-            # add client filter condition
-            client_id = self.client_combo.currentData()
-            if client_id and client_id != "all":
-                query += " AND c.client_id = %s"
-                params.append(client_id)
-            
-            cursor.execute(query, params)
-            
-            # get column names
-            columns = [desc[0] for desc in cursor.description]
-            
-            # get data
-            rows = cursor.fetchall()
-            
-            # create DataFrame
-            df = pd.DataFrame(rows, columns=columns)
-            
-            return df
-            
-        except Exception as e:
-            print(f"Failed to get client data: {e}")
-            traceback.print_exc()
-            return None
-        finally:
-            if conn:
-                self.release_db_connection(conn)
-    
-    def get_device_data(self):
-        """Get device stats data"""
-        conn = None
-        try:
-            conn = self.get_db_connection()
-            if not conn:
-                return None
-                
-            start_date = self.start_date.date().toString("yyyy-MM-dd")
-            end_date = self.end_date.date().addDays(1).toString("yyyy-MM-dd")
-            
-            cursor = conn.cursor()
-            
-            query = """
-                SELECT 
-                    d.date,
-                    d.client_id,
-                    g.client_name,
-                    d.device_index,
-                    d.device_name,
-                    d.avg_utilization,
-                    d.avg_temperature,
-                    d.avg_power_usage,
-                    d.avg_memory_usage
-                FROM device_daily_stats d
-                LEFT JOIN gpu_assets g ON d.client_id = g.client_id
-                WHERE d.date >= %s AND d.date <= %s
-            """
-            params = [start_date, end_date]
-            
-            # add device filter condition
-            device_id = self.device_combo.currentData()
-            if device_id and device_id != "all":
-                query += " AND d.device_index = %s"
-                params.append(device_id)
-            
-            cursor.execute(query, params)
-            
-            # get column names
-            columns = [desc[0] for desc in cursor.description]
-            
-            # get data
-            rows = cursor.fetchall()
-            
-            # Create DataFrame
-            df = pd.DataFrame(rows, columns=columns)
-            
-            return df
-            
-        except Exception as e:
-            print(f"Failed to get device data: {e}")
-            traceback.print_exc()
-            return None
-        finally:
-            if conn:
-                self.release_db_connection(conn)
+
+    def _build_client_export_query(self):
+        """Build the client stats detail query for the current filters
+
+        Returns:
+            tuple: (query text with %s placeholders, parameter list)
+        """
+        start_date = self.start_date.date().toString("yyyy-MM-dd")
+        end_date = self.end_date.date().addDays(1).toString("yyyy-MM-dd")
+
+        query = """
+            SELECT
+                c.date,
+                c.client_id,
+                g.client_name,
+                c.total_heartbeats,
+                c.avg_cpu_usage,
+                c.avg_memory_usage,
+                c.avg_disk_usage,
+                c.total_network_in_bytes,
+                c.total_network_out_bytes
+            FROM client_daily_stats c
+            LEFT JOIN gpu_assets g ON c.client_id = g.client_id
+            WHERE c.date >= %s AND c.date <= %s
+        """
+        params = [start_date, end_date]
+
+        # add client filter condition
+        client_id = self.client_combo.currentData()
+        if client_id and client_id != "all":
+            query += " AND c.client_id = %s"
+            params.append(client_id)
+
+        return query, params
+
+    def _build_device_export_query(self):
+        """Build the device stats detail query for the current filters
+
+        Returns:
+            tuple: (query text with %s placeholders, parameter list)
+        """
+        start_date = self.start_date.date().toString("yyyy-MM-dd")
+        end_date = self.end_date.date().addDays(1).toString("yyyy-MM-dd")
+
+        query = """
+            SELECT
+                d.date,
+                d.client_id,
+                g.client_name,
+                d.device_index,
+                d.device_name,
+                d.avg_utilization,
+                d.avg_temperature,
+                d.avg_power_usage,
+                d.avg_memory_usage
+            FROM device_daily_stats d
+            LEFT JOIN gpu_assets g ON d.client_id = g.client_id
+            WHERE d.date >= %s AND d.date <= %s
+        """
+        params = [start_date, end_date]
+
+        # add device filter condition
+        device_id = self.device_combo.currentData()
+        if device_id and device_id != "all":
+            query += " AND d.device_index = %s"
+            params.append(device_id)
+
+        return query, params
+
 
 def main():
     import os
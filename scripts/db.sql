@@ -157,9 +157,16 @@ CREATE TABLE IF NOT EXISTS client_daily_stats (
 ALTER TABLE client_daily_stats
 ADD COLUMN IF NOT EXISTS last_heartbeat_bucket BIGINT NOT NULL DEFAULT 0;
 
-CREATE INDEX IF NOT EXISTS idx_client_daily_stats_client_id_date 
+CREATE INDEX IF NOT EXISTS idx_client_daily_stats_client_id_date
 ON client_daily_stats (client_id, date DESC);
 
+-- Covering index for the dashboard's date-range reads: the range scan
+-- consumes the (date DESC, client_id) sort order directly, and INCLUDE
+-- keeps the plotted metrics in the index so they are index-only scans.
+CREATE INDEX IF NOT EXISTS idx_client_daily_stats_date_client_covering
+ON client_daily_stats (date DESC, client_id)
+INCLUDE (avg_cpu_usage, avg_memory_usage, total_network_in_bytes, total_network_out_bytes);
+
 CREATE TABLE IF NOT EXISTS device_daily_stats (
     id BIGSERIAL,
     date DATE NOT NULL,
@@ -187,6 +194,14 @@ ADD COLUMN IF NOT EXISTS last_heartbeat_bucket BIGINT NOT NULL DEFAULT 0;
 CREATE INDEX IF NOT EXISTS idx_device_daily_stats_date ON device_daily_stats (date);
 CREATE INDEX IF NOT EXISTS idx_device_daily_stats_client_id ON device_daily_stats (client_id);
 CREATE INDEX IF NOT EXISTS idx_device_daily_stats_device_index ON device_daily_stats (device_index);
+CREATE INDEX IF NOT EXISTS idx_device_daily_stats_date_client_device
+ON device_daily_stats (date, client_id, device_index);
+
+-- Covering equivalent for the device date-range reads (see the client
+-- covering index above)
+CREATE INDEX IF NOT EXISTS idx_device_daily_stats_date_client_device_covering
+ON device_daily_stats (date DESC, client_id, device_index)
+INCLUDE (device_name, avg_utilization, avg_temperature, avg_power_usage, avg_memory_usage);
 
 CREATE TABLE IF NOT EXISTS heartbeat_config_daily (
     date DATE PRIMARY KEY,
@@ -368,6 +383,31 @@ BEGIN
 END;
 $$;
 
+-- Pre-joined daily device stats for the dashboard GUI, so its queries are
+-- a single indexed scan instead of a join + aggregation per refresh
+CREATE MATERIALIZED VIEW IF NOT EXISTS dashboard_device_daily AS
+SELECT
+    d.date,
+    d.client_id,
+    g.client_name,
+    d.device_index,
+    d.device_name,
+    AVG(d.avg_utilization) AS avg_utilization,
+    AVG(d.avg_temperature) AS avg_temperature,
+    AVG(d.avg_power_usage) AS avg_power_usage,
+    AVG(d.avg_memory_usage) AS avg_memory_usage
+FROM device_daily_stats d
+LEFT JOIN gpu_assets g ON g.client_id = d.client_id
+GROUP BY d.date, d.client_id, g.client_name, d.device_index, d.device_name;
+
+-- Unique index so the heartbeat consumer can run REFRESH MATERIALIZED
+-- VIEW CONCURRENTLY directly (CONCURRENTLY is not legal inside a
+-- plpgsql function, so no refresh function is provided here)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_dashboard_device_daily_pk
+ON dashboard_device_daily (date, client_id, device_index);
+
+CREATE INDEX IF NOT EXISTS idx_dashboard_device_daily_date ON dashboard_device_daily (date);
+
 -- Insert test data for client_models
 -- engine_type: 1=Ollama, 2=Vllm, 3=TensorRT, 4=ONNX, 5=None, 6=Llama
 -- expected_size unit: bytes